@@ -1,7 +1,9 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 import google.generativeai as genai
 from config import Config
-from exceptions import StoryGenerationError
+from exceptions import StoryGenerationError, GenerationCapacityError
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +16,32 @@ except Exception as e:
     logger.error(f"Failed to configure Gemini AI: {e}")
     raise
 
+# Per-worker cap on in-flight generations
+_generation_slots = asyncio.Semaphore(Config.MAX_CONCURRENT_GENERATIONS)
+
+@asynccontextmanager
+async def generation_slot():
+    """Reserve one of this worker's generation slots, failing fast when all are busy"""
+    if _generation_slots.locked():
+        raise GenerationCapacityError(
+            f"Worker is already running {Config.MAX_CONCURRENT_GENERATIONS} story generations"
+        )
+    async with _generation_slots:
+        yield
+
 # Story generation service
 class StoryService:
     """Service class for story generation"""
     
+    @staticmethod
+    async def warm_up():
+        """Open the AI client connection ahead of the first story request"""
+        try:
+            await model.count_tokens_async("warm up")
+            logger.info("Gemini AI client warmed up")
+        except Exception as e:
+            logger.warning(f"Gemini AI warm-up failed: {str(e)}")
+    
     @staticmethod
     def create_story_prompt(character_name: str, character_details: str) -> str:
         """Create a simple but effective prompt for story generation"""
@@ -147,7 +171,7 @@ Write the complete story now using simple, clear language:
                 max_output_tokens=1500,  # Enough for a good story
             )
             
-            response = model.generate_content(
+            response = await model.generate_content_async(
                 prompt,
                 generation_config=generation_config
             )
@@ -191,7 +215,7 @@ Write the improved story now:
             
             logger.info(f"Improving story for character: {character_name}")
             
-            response = model.generate_content(improve_prompt)
+            response = await model.generate_content_async(improve_prompt)
             
             if not response.text:
                 raise StoryGenerationError("Could not improve the story")
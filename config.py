@@ -1,4 +1,5 @@
 import os
+import math
 import logging
 from dotenv import load_dotenv
 
@@ -24,6 +25,61 @@ class Config:
     DB_HOST = os.getenv("DB_HOST")
     DB_NAME = os.getenv("DB_NAME", "postgres")
     GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
+
+    # Per-worker database pool (each worker process holds its own pool)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+
+    # Production server settings
+    HOST = os.getenv("HOST", "0.0.0.0")
+    PORT = int(os.getenv("PORT", "8000"))
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "0"))  # 0 = one worker per CPU
+    MAX_DEFAULT_WORKERS = 8  # Cap when sizing from CPUs, keeps the DB connection total bounded
+    SERVER_LOOP = os.getenv("SERVER_LOOP", "auto")  # "auto" uses uvloop when installed
+    SERVER_HTTP = os.getenv("SERVER_HTTP", "auto")  # "auto" uses httptools when installed
+    GRACEFUL_SHUTDOWN_TIMEOUT = int(os.getenv("GRACEFUL_SHUTDOWN_TIMEOUT", "120"))
+
+    # Per-worker request limits
+    MAX_CONCURRENT_GENERATIONS = int(os.getenv("MAX_CONCURRENT_GENERATIONS", "8"))
+    MAX_REQUEST_BODY_SIZE = int(os.getenv("MAX_REQUEST_BODY_SIZE", "65536"))
+    
+    @staticmethod
+    def _cgroup_cpu_limit():
+        """CPU limit from the container's cgroup quota, or None when unlimited"""
+        try:
+            # cgroup v2
+            with open("/sys/fs/cgroup/cpu.max") as f:
+                quota, period = f.read().split()[:2]
+            if quota != "max":
+                return int(quota) / int(period)
+            return None
+        except (OSError, ValueError):
+            pass
+        try:
+            # cgroup v1
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+                quota = int(f.read())
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+                period = int(f.read())
+            if quota > 0 and period > 0:
+                return quota / period
+        except (OSError, ValueError):
+            pass
+        return None
+    
+    @classmethod
+    def get_worker_count(cls) -> int:
+        """Number of server worker processes, sized from available CPUs by default"""
+        if cls.WEB_CONCURRENCY > 0:
+            return cls.WEB_CONCURRENCY
+        try:
+            cpus = len(os.sched_getaffinity(0))
+        except AttributeError:
+            cpus = os.cpu_count() or 1
+        cpu_limit = cls._cgroup_cpu_limit()
+        if cpu_limit is not None:
+            cpus = min(cpus, math.ceil(cpu_limit))
+        return max(min(cpus, cls.MAX_DEFAULT_WORKERS), 1)
     
     @classmethod
     def validate_config(cls):
@@ -37,4 +93,10 @@ class Config:
             missing_vars.append("GEMINI_API_KEY")
         
         if missing_vars:
-            raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
\ No newline at end of file
+            raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
+        
+        if cls.MAX_CONCURRENT_GENERATIONS > cls.DB_POOL_SIZE + cls.DB_MAX_OVERFLOW:
+            raise ValueError(
+                "MAX_CONCURRENT_GENERATIONS must not exceed DB_POOL_SIZE + DB_MAX_OVERFLOW "
+                f"({cls.MAX_CONCURRENT_GENERATIONS} > {cls.DB_POOL_SIZE + cls.DB_MAX_OVERFLOW})"
+            )
\ No newline at end of file
@@ -1,8 +1,11 @@
 import logging
+import asyncio
 from urllib.parse import quote_plus
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from config import Config
+from models import Base
 
 logger = logging.getLogger(__name__)
 
@@ -12,10 +15,31 @@ engine = create_async_engine(
     DATABASE_URL,
     pool_pre_ping=True,  # Verify connections before use
     pool_recycle=3600,   # Recycle connections after 1 hour
+    pool_size=Config.DB_POOL_SIZE,        # Per-worker pool size
+    max_overflow=Config.DB_MAX_OVERFLOW,  # Extra connections allowed under burst
     echo=False           # Set to True for SQL query logging
 )
 SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
 
+# Arbitrary key shared by every worker to serialize schema creation
+SCHEMA_LOCK_KEY = 4237261
+
+async def create_tables():
+    """Create database tables, one worker at a time"""
+    async with engine.begin() as conn:
+        # Held until the transaction ends, so concurrent workers cannot race on CREATE TABLE
+        await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
+        await conn.run_sync(Base.metadata.create_all)
+
+async def warm_up_pool():
+    """Open the worker's pooled connections ahead of the first request"""
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(Config.DB_POOL_SIZE)))
+    logger.info(f"Database pool warmed with {Config.DB_POOL_SIZE} connections")
+
 # Database dependency
 async def get_db():
     """Database session dependency"""
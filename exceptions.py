@@ -9,4 +9,8 @@ class StoryGenerationError(Exception):
 
 class DatabaseError(Exception):
     """Raised when database operations fail"""
+    pass
+
+class GenerationCapacityError(Exception):
+    """Raised when a worker is already running its maximum number of generations"""
     pass
\ No newline at end of file
@@ -4,17 +4,19 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import Config, logger
-from database import engine
-from models import Base
+from database import engine, create_tables, warm_up_pool
+from ai_service import StoryService
 from routes import router
 from middleware import (
     request_id_middleware,
+    body_size_limit_middleware,
     character_not_found_handler,
     story_generation_error_handler,
+    generation_capacity_handler,
     database_error_handler,
     general_exception_handler
 )
-from exceptions import CharacterNotFoundError, StoryGenerationError, DatabaseError
+from exceptions import CharacterNotFoundError, StoryGenerationError, DatabaseError, GenerationCapacityError
 
 # Validate configuration on startup
 try:
@@ -31,9 +33,11 @@ async def lifespan(app: FastAPI):
     logger.info("Starting application...")
     try:
         # Startup
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        await create_tables()
         logger.info("Database tables created successfully")
+        # Pre-warm this worker's DB pool and AI client
+        await warm_up_pool()
+        await StoryService.warm_up()
         yield
     except Exception as e:
         logger.error(f"Application startup failed: {str(e)}")
@@ -63,12 +67,16 @@ app.add_middleware(
     max_age=3600,
 )
 
+# Reject oversized request bodies before they reach the routes
+app.middleware("http")(body_size_limit_middleware)
+
 # Add request ID middleware
 app.middleware("http")(request_id_middleware)
 
 # Global exception handlers
 app.add_exception_handler(CharacterNotFoundError, character_not_found_handler)
 app.add_exception_handler(StoryGenerationError, story_generation_error_handler)
+app.add_exception_handler(GenerationCapacityError, generation_capacity_handler)
 app.add_exception_handler(DatabaseError, database_error_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
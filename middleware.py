@@ -4,7 +4,8 @@ from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 
 from schemas import ErrorResponse
-from exceptions import CharacterNotFoundError, StoryGenerationError, DatabaseError
+from config import Config
+from exceptions import CharacterNotFoundError, StoryGenerationError, DatabaseError, GenerationCapacityError
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,35 @@ async def request_id_middleware(request: Request, call_next):
     logger.info(f"Request {request_id} completed with status {response.status_code}")
     return response
 
+# Request body size middleware
+async def body_size_limit_middleware(request: Request, call_next):
+    """Reject request bodies larger than the per-worker limit"""
+    if request.method in ("POST", "PUT", "PATCH"):
+        content_length = request.headers.get("content-length")
+        if content_length is None:
+            return _body_size_error(request, 411, "Length Required", "Content-Length header is required")
+        if not content_length.isdigit() or int(content_length) > Config.MAX_REQUEST_BODY_SIZE:
+            return _body_size_error(
+                request,
+                413,
+                "Request body too large",
+                f"Request body must not exceed {Config.MAX_REQUEST_BODY_SIZE} bytes"
+            )
+    
+    return await call_next(request)
+
+def _body_size_error(request: Request, status_code: int, error: str, detail: str) -> JSONResponse:
+    logger.warning(f"Rejected request body: {detail}")
+    return JSONResponse(
+        status_code=status_code,
+        content=ErrorResponse(
+            error=error,
+            detail=detail,
+            timestamp=str(uuid.uuid4()),
+            request_id=str(getattr(request.state, 'request_id', uuid.uuid4()))
+        ).dict()
+    )
+
 # Exception handlers
 async def character_not_found_handler(request: Request, exc: CharacterNotFoundError):
     logger.warning(f"Character not found: {str(exc)}")
@@ -47,6 +77,19 @@ async def story_generation_error_handler(request: Request, exc: StoryGenerationE
         ).dict()
     )
 
+async def generation_capacity_handler(request: Request, exc: GenerationCapacityError):
+    logger.warning(f"Generation capacity reached: {str(exc)}")
+    return JSONResponse(
+        status_code=503,
+        headers={"Retry-After": "5"},
+        content=ErrorResponse(
+            error="Story generation busy",
+            detail=str(exc),
+            timestamp=str(uuid.uuid4()),
+            request_id=str(getattr(request.state, 'request_id', uuid.uuid4()))
+        ).dict()
+    )
+
 async def database_error_handler(request: Request, exc: DatabaseError):
     logger.error(f"Database error: {str(exc)}")
     return JSONResponse(
@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db, SessionLocal
 from schemas import CharacterCreate, CharacterResponse, GenerateStoryRequest, StoryResponse
 from db_service import DatabaseService
-from ai_service import StoryService
+from ai_service import StoryService, generation_slot
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -67,18 +67,18 @@ async def list_characters(db: AsyncSession = Depends(get_db)):
     return await DatabaseService.list_characters(db)
 
 @router.post("/stories/generate/", response_model=StoryResponse, tags=["Stories"])
-async def generate_story(
-    request: GenerateStoryRequest, 
-    db: AsyncSession = Depends(get_db)
-):
+async def generate_story(request: GenerateStoryRequest):
     """Generate a story for a character"""
     logger.info(f"Generating story for character: {request.name}")
     
-    # Get character from database
-    character = await DatabaseService.get_character_by_name(db, request.name)
-    
-    # Generate story
-    story = await StoryService.generate_story(character.name, character.details)
+    # Take a generation slot first so requests over this worker's cap fail fast
+    async with generation_slot():
+        # Use a short-lived session so no connection is held during the AI call
+        async with SessionLocal() as db:
+            character = await DatabaseService.get_character_by_name(db, request.name)
+        
+        # Generate story
+        story = await StoryService.generate_story(character.name, character.details)
     
     # Calculate word count
     word_count = len(story.split())
@@ -0,0 +1,33 @@
+import uvicorn
+
+from config import Config, logger
+
+# Production server entry point
+def run():
+    """Run the API with multiple worker processes and graceful shutdown"""
+    workers = Config.get_worker_count()
+    logger.info(
+        f"Starting production server on {Config.HOST}:{Config.PORT} with {workers} workers "
+        f"(loop={Config.SERVER_LOOP}, http={Config.SERVER_HTTP})"
+    )
+    logger.info(
+        f"Database connections: up to {workers * (Config.DB_POOL_SIZE + Config.DB_MAX_OVERFLOW)} total "
+        f"({workers} workers x (DB_POOL_SIZE {Config.DB_POOL_SIZE} + DB_MAX_OVERFLOW {Config.DB_MAX_OVERFLOW})), "
+        f"{workers * Config.DB_POOL_SIZE} opened at startup"
+    )
+    uvicorn.run(
+        "main:app",
+        host=Config.HOST,
+        port=Config.PORT,
+        workers=workers,
+        loop=Config.SERVER_LOOP,
+        http=Config.SERVER_HTTP,
+        # On SIGTERM each worker stops accepting connections and waits this long
+        # for in-flight story generations to finish before cancelling them
+        timeout_graceful_shutdown=Config.GRACEFUL_SHUTDOWN_TIMEOUT,
+        proxy_headers=True,
+        log_level="info"
+    )
+
+if __name__ == "__main__":
+    run()